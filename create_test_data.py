@@ -6,7 +6,7 @@ Simple script to create testing directories and sample data
 import os
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 
 def main():
     """Create testing/physiological directory and sample data file"""
@@ -17,18 +17,10 @@ def main():
     physio_dir = os.path.join(testing_dir, "physiological")
     
     print(f"Creating directory: {testing_dir}")
-    if not os.path.exists(testing_dir):
-        os.makedirs(testing_dir)
-        print(f"Created directory: {testing_dir}")
-    else:
-        print(f"Directory already exists: {testing_dir}")
+    os.makedirs(testing_dir, exist_ok=True)
     
     print(f"Creating directory: {physio_dir}")
-    if not os.path.exists(physio_dir):
-        os.makedirs(physio_dir)
-        print(f"Created directory: {physio_dir}")
-    else:
-        print(f"Directory already exists: {physio_dir}")
+    os.makedirs(physio_dir, exist_ok=True)
     
     # Create sample data
     print("Creating sample eye tracking data...")
@@ -40,7 +32,7 @@ def main():
     # Create a simple DataFrame with eye tracking data
     num_points = 180
     base_time = datetime(2025, 2, 26, 16, 0)
-    timestamps = [base_time + timedelta(minutes=i) for i in range(num_points)]
+    timestamps = pd.date_range(start=base_time, periods=num_points, freq="1min")
     
     # Generate sample data
     np.random.seed(42)  # For reproducibility
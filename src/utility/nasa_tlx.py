@@ -1,40 +1,20 @@
 import os
 import sys
+import json
+import argparse
 import getpass
-import matplotlib.pyplot as plt
-from fpdf import FPDF
-
-def get_input(prompt, min_val=0, max_val=100):
-    """Get validated integer input between min_val and max_val"""
-    while True:
-        try:
-            value = int(input(prompt))
-            if min_val <= value <= max_val:
-                return value
-            else:
-                print(f"Please enter a number between {min_val} and {max_val}.")
-        except ValueError:
-            print("Invalid input. Please enter a valid number.")
-
-# Welcome message
-print("\nNASA Task Load Index (NASA-TLX) Assessment\n")
-participant_id = input("Enter Participant ID: ")
-task_id = input("Enter Task ID: ")
-
-# NASA-TLX Rating Scales (0-100)
-ratings = {}
-ratings["Mental Demand"] = get_input("Mental Demand (0-100): ")
-ratings["Physical Demand"] = get_input("Physical Demand (0-100): ")
-ratings["Temporal Demand"] = get_input("Temporal Demand (0-100): ")
-ratings["Performance"] = get_input("Performance (0-100): ")
-ratings["Effort"] = get_input("Effort (0-100): ")
-ratings["Frustration"] = get_input("Frustration (0-100): ")
-
-# Unweighted score calculation (average of 6 factors)
-unweighted_score = sum(ratings.values()) / len(ratings)
+import numpy as np
+
+FACTORS = [
+    "Mental Demand",
+    "Physical Demand",
+    "Temporal Demand",
+    "Performance",
+    "Effort",
+    "Frustration",
+]
 
 # NASA-TLX Ranking Comparisons
-print("\nNow, you will rank which factors contributed more to workload in 15 pairwise comparisons.\n")
 comparisons = [
     ("Mental Demand", "Physical Demand"),
     ("Mental Demand", "Temporal Demand"),
@@ -53,21 +33,79 @@ comparisons = [
     ("Frustration", "Effort"),
 ]
 
-rankings = {factor: 0 for factor in ratings.keys()}
-
-for factor1, factor2 in comparisons:
-    choice = None
-    while choice not in [1, 2]:
+def get_input(prompt, min_val=0, max_val=100):
+    """Get validated integer input between min_val and max_val"""
+    while True:
         try:
-            choice = int(input(f"Which is more important for workload? (1) {factor1} or (2) {factor2}: "))
-            if choice == 1:
-                rankings[factor1] += 1
-            elif choice == 2:
-                rankings[factor2] += 1
+            value = int(input(prompt))
+            if min_val <= value <= max_val:
+                return value
             else:
-                print("Please enter 1 or 2.")
+                print(f"Please enter a number between {min_val} and {max_val}.")
         except ValueError:
-            print("Invalid input. Please enter 1 or 2.")
+            print("Invalid input. Please enter a valid number.")
+
+def is_integer(value):
+    """True for JSON integers (bools are ints in Python but not valid answers)"""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def load_answers(path):
+    """Load participant details, ratings and the 15 pairwise choices from a JSON file"""
+    with open(path) as f:
+        answers = json.load(f)
+    ratings = {factor: answers["ratings"][factor] for factor in FACTORS}
+    # Match the interactive prompts, which only accept whole numbers
+    if not all(is_integer(value) and 0 <= value <= 100 for value in ratings.values()):
+        raise ValueError("ratings must be whole numbers between 0 and 100")
+    choices = answers["choices"]
+    if (not isinstance(choices, list) or len(choices) != len(comparisons)
+            or not all(is_integer(choice) and choice in (1, 2) for choice in choices)):
+        raise ValueError(f"expected {len(comparisons)} choices, each 1 or 2")
+    choices = np.array(choices, dtype=int)
+    return str(answers["participant_id"]), str(answers["task_id"]), ratings, choices
+
+parser = argparse.ArgumentParser(description="NASA Task Load Index (NASA-TLX) Assessment")
+parser.add_argument("--answers", metavar="PATH",
+                    help="JSON file with participant_id, task_id, ratings and the 15 pairwise "
+                         "choices (1 or 2); skips the interactive prompts")
+args = parser.parse_args()
+
+# Welcome message
+print("\nNASA Task Load Index (NASA-TLX) Assessment\n")
+
+if args.answers:
+    try:
+        participant_id, task_id, ratings, choices = load_answers(args.answers)
+    except (OSError, KeyError, TypeError, ValueError) as e:
+        sys.exit(f"Invalid answers file {args.answers}: {e}")
+else:
+    participant_id = input("Enter Participant ID: ")
+    task_id = input("Enter Task ID: ")
+
+    # NASA-TLX Rating Scales (0-100)
+    ratings = {factor: get_input(f"{factor} (0-100): ") for factor in FACTORS}
+
+    print("\nNow, you will rank which factors contributed more to workload in 15 pairwise comparisons.\n")
+    choices = []
+    for factor1, factor2 in comparisons:
+        choice = None
+        while choice not in [1, 2]:
+            try:
+                choice = int(input(f"Which is more important for workload? (1) {factor1} or (2) {factor2}: "))
+                if choice not in [1, 2]:
+                    print("Please enter 1 or 2.")
+            except ValueError:
+                print("Invalid input. Please enter 1 or 2.")
+        choices.append(choice)
+    choices = np.array(choices)
+
+# Unweighted score calculation (average of 6 factors)
+unweighted_score = sum(ratings.values()) / len(ratings)
+
+# Tally the times each factor was selected with a single bincount over the winners
+pair_index = np.array([[FACTORS.index(f1), FACTORS.index(f2)] for f1, f2 in comparisons])
+winners = pair_index[np.arange(len(comparisons)), choices - 1]
+rankings = dict(zip(FACTORS, np.bincount(winners, minlength=len(FACTORS)).tolist()))
 
 # Weighted workload score calculation
 weighted_score = sum((rankings[factor] / 15) * ratings[factor] for factor in ratings)
@@ -76,6 +114,10 @@ weighted_score = sum((rankings[factor] / 15) * ratings[factor] for factor in rat
 downloads_dir = os.path.join(os.path.expanduser("~"), "Downloads")
 pdf_path = os.path.join(downloads_dir, f"NASA_TLX_Report_{participant_id}.pdf")
 
+# Reporting dependencies are only needed once all answers are collected
+import matplotlib.pyplot as plt
+from fpdf import FPDF
+
 # Generate Visualization
 plt.figure(figsize=(8, 5))
 plt.barh(list(ratings.keys()), list(ratings.values()), color='dodgerblue')
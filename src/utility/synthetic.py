@@ -1,13 +1,15 @@
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 import logging
 from typing import Union, Dict, List, Tuple, Optional
 import json
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
 from scipy.signal import savgol_filter
 import os
-import matplotlib.pyplot as plt
-import seaborn as sns
+import copy
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -16,9 +18,7 @@ logger = logging.getLogger(__name__)
 # Ensure testing directory structure exists
 def ensure_dir_exists(directory_path: str):
     """Create directory if it doesn't exist"""
-    if not os.path.exists(directory_path):
-        os.makedirs(directory_path)
-        logger.info(f"Created directory: {directory_path}")
+    os.makedirs(directory_path, exist_ok=True)
 
 # Create required directories
 TESTING_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "testing")
@@ -26,63 +26,111 @@ PHYSIO_DIR = os.path.join(TESTING_DIR, "physiological")
 ensure_dir_exists(TESTING_DIR)
 ensure_dir_exists(PHYSIO_DIR)
 
+# Default generator configuration, used when no config is supplied
+DEFAULT_CONFIG = {
+    'base_time': datetime(2025, 2, 26, 16, 0),
+    'duration_hours': 3,
+    'resolution_min': 1,
+    'signal_ranges': {
+        'SpO2': (88, 100),
+        'pulse_rate': (60, 140),
+        'blood_pressure_sys': (90, 180),
+        'resp_rate': (12, 30),
+        'temperature': (36.0, 38.5),
+        # Eye tracking parameters
+        'pupil_diameter_left': (2.0, 8.0),  # mm
+        'pupil_diameter_right': (2.0, 8.0),  # mm
+        'gaze_x': (-30, 30),  # degrees from center
+        'gaze_y': (-20, 20),  # degrees from center
+        'blink_rate': (0, 1),  # binary indicator
+        'fixation_duration': (50, 500)  # milliseconds
+    },
+    'event_definitions': {
+        'hypoxemia': {
+            'SpO2': {'min': 70, 'max': 90},
+            'pulse_rate': {'delta': +15},
+            'resp_rate': {'delta': +5},
+            'pupil_diameter_left': {'delta': -1.0},
+            'pupil_diameter_right': {'delta': -1.0}
+        },
+        'tachycardia': {
+            'pulse_rate': {'min': 110, 'max': 140},
+            'blood_pressure_sys': {'delta': +20},
+            'pupil_diameter_left': {'delta': +1.5},
+            'pupil_diameter_right': {'delta': +1.5}
+        },
+        'fever': {
+            'temperature': {'min': 37.8, 'max': 39.5},
+            'pulse_rate': {'delta': +10},
+            'pupil_diameter_left': {'delta': +0.8},
+            'pupil_diameter_right': {'delta': +0.8}
+        },
+        'cognitive_load': {
+            'pupil_diameter_left': {'delta': +2.0},
+            'pupil_diameter_right': {'delta': +2.0},
+            'fixation_duration': {'delta': +100},
+            'blink_rate': {'delta': -0.3}
+        },
+        'fatigue': {
+            'blink_rate': {'delta': +0.5},
+            'pupil_diameter_left': {'delta': -1.2},
+            'pupil_diameter_right': {'delta': -1.2},
+            'fixation_duration': {'delta': -50}
+        }
+    }
+}
+
 class ClinicalDataGenerator:
     """Production-grade synthetic clinical data generator with enhanced features"""
     
+    # Row order of the float32 signal buffer built by generate_base_signals
+    SIGNAL_NAMES = (
+        'SpO2', 'pulse_rate', 'blood_pressure_sys', 'resp_rate', 'temperature',
+        'pupil_diameter_left', 'pupil_diameter_right', 'gaze_x', 'gaze_y',
+        'blink_rate', 'fixation_duration'
+    )
+    
+    # (mean, std) of the Gaussian term drawn for each signal in generate_base_signals
+    NOISE_PARAMS = {
+        'SpO2': (97.5, 1.0),
+        'pulse_rate': (80.0, 3.0),
+        'blood_pressure_sys': (0.0, 3.0),
+        'resp_rate': (0.0, 1.0),
+        'temperature': (36.8, 0.2),
+        'pupil_diameter_left': (0.0, 0.3),
+        'pupil_diameter_right': (0.0, 0.1),
+        'gaze_x': (0.0, 2.0),
+        'gaze_y': (0.0, 2.0),
+        'fixation_duration': (0.0, 30.0)
+    }
+    
     def __init__(self, config: Dict = None):
-        self.config = config or {
-            'base_time': datetime(2025, 2, 26, 16, 0),
-            'duration_hours': 3,
-            'resolution_min': 1,
-            'signal_ranges': {
-                'SpO2': (88, 100),
-                'pulse_rate': (60, 140),
-                'blood_pressure_sys': (90, 180),
-                'resp_rate': (12, 30),
-                'temperature': (36.0, 38.5),
-                # Eye tracking parameters
-                'pupil_diameter_left': (2.0, 8.0),  # mm
-                'pupil_diameter_right': (2.0, 8.0),  # mm
-                'gaze_x': (-30, 30),  # degrees from center
-                'gaze_y': (-20, 20),  # degrees from center
-                'blink_rate': (0, 1),  # binary indicator
-                'fixation_duration': (50, 500)  # milliseconds
-            },
-            'event_definitions': {
-                'hypoxemia': {
-                    'SpO2': {'min': 70, 'max': 90},
-                    'pulse_rate': {'delta': +15},
-                    'resp_rate': {'delta': +5},
-                    'pupil_diameter_left': {'delta': -1.0},
-                    'pupil_diameter_right': {'delta': -1.0}
-                },
-                'tachycardia': {
-                    'pulse_rate': {'min': 110, 'max': 140},
-                    'blood_pressure_sys': {'delta': +20},
-                    'pupil_diameter_left': {'delta': +1.5},
-                    'pupil_diameter_right': {'delta': +1.5}
-                },
-                'fever': {
-                    'temperature': {'min': 37.8, 'max': 39.5},
-                    'pulse_rate': {'delta': +10},
-                    'pupil_diameter_left': {'delta': +0.8},
-                    'pupil_diameter_right': {'delta': +0.8}
-                },
-                'cognitive_load': {
-                    'pupil_diameter_left': {'delta': +2.0},
-                    'pupil_diameter_right': {'delta': +2.0},
-                    'fixation_duration': {'delta': +100},
-                    'blink_rate': {'delta': -0.3}
-                },
-                'fatigue': {
-                    'blink_rate': {'delta': +0.5},
-                    'pupil_diameter_left': {'delta': -1.2},
-                    'pupil_diameter_right': {'delta': -1.2},
-                    'fixation_duration': {'delta': -50}
-                }
-            }
-        }
+        self.config = config or copy.deepcopy(DEFAULT_CONFIG)
         self.validate_config()
+        # The config is not modified after validation, so serialize it for df.attrs once
+        self._config_json = json.dumps(self.config, default=str)
+        # Single PCG64 generator reused by every sampling step; seed via config['seed']
+        self.rng = np.random.default_rng(self.config.get('seed'))
+        # Signal name -> row of the (n_signals, num_points) buffer; the buffer itself
+        # is (re)allocated by generate_base_signals
+        self._signal_index = {name: i for i, name in enumerate(self.SIGNAL_NAMES)}
+        self._buf = None
+        # Per-row clip bounds broadcast against the buffer; signals without a range are unbounded
+        sr = self.config['signal_ranges']
+        self._lows = np.array([sr.get(name, (-np.inf, np.inf))[0] for name in self.SIGNAL_NAMES],
+                              dtype=np.float32)[:, None]
+        self._highs = np.array([sr.get(name, (-np.inf, np.inf))[1] for name in self.SIGNAL_NAMES],
+                               dtype=np.float32)[:, None]
+        # Gaze oscillation terms depend only on the series length, so build them once
+        num_points = self.config['duration_hours'] * 60 // self.config['resolution_min']
+        self._sin01, self._sin03, self._cos01, self._cos02 = self._gaze_basis(num_points)
+        
+    @staticmethod
+    def _gaze_basis(num_points: int) -> Tuple[np.ndarray, ...]:
+        """Return the sin(0.1t), sin(0.3t), cos(0.1t), cos(0.2t) gaze scanning terms"""
+        t = np.linspace(0, 2*np.pi*10, num_points)  # Time vector for oscillations
+        return tuple(np.asarray(f(k*t), dtype=np.float32)
+                     for f, k in ((np.sin, 0.1), (np.sin, 0.3), (np.cos, 0.1), (np.cos, 0.2)))
         
     def validate_config(self):
         """Ensure configuration parameters are valid"""
@@ -97,46 +145,55 @@ class ClinicalDataGenerator:
 
     def generate_base_signals(self, num_points: int) -> Dict[str, np.ndarray]:
         """Generate baseline physiological signals with cross-correlation"""
-        signals = {}
-        sr = self.config['signal_ranges']
+        # One contiguous float32 buffer (one row per signal); the dict holds row views
+        self._buf = buf = np.empty((len(self.SIGNAL_NAMES), num_points), dtype=np.float32)
+        signals = {name: buf[i] for name, i in self._signal_index.items()}
+        
+        # Draw every Gaussian term in a single batch, scaled row-wise to (mean, std)
+        mus, sigmas = np.array(list(self.NOISE_PARAMS.values()), dtype=np.float32).T
+        z = self.rng.standard_normal((len(self.NOISE_PARAMS), num_points), dtype=np.float32)
+        z *= sigmas[:, None]
+        z += mus[:, None]
+        noise = dict(zip(self.NOISE_PARAMS, z))
         
         # Base vital signs with realistic correlations
-        signals['SpO2'] = np.clip(np.random.normal(97.5, 1.0, num_points), *sr['SpO2'])
-        signals['pulse_rate'] = np.random.normal(80, 3, num_points)
-        signals['blood_pressure_sys'] = 120 + 0.5*(signals['pulse_rate'] - 80) + np.random.normal(0, 3, num_points)
-        signals['resp_rate'] = 18 + 0.2*(signals['pulse_rate'] - 80) + np.random.normal(0, 1, num_points)
-        signals['temperature'] = np.random.normal(36.8, 0.2, num_points)
+        signals['SpO2'][:] = noise['SpO2']
+        signals['pulse_rate'][:] = noise['pulse_rate']
+        signals['blood_pressure_sys'][:] = 120 + 0.5*(signals['pulse_rate'] - 80) + noise['blood_pressure_sys']
+        signals['resp_rate'][:] = 18 + 0.2*(signals['pulse_rate'] - 80) + noise['resp_rate']
+        signals['temperature'][:] = noise['temperature']
         
         # Eye tracking data with realistic patterns
         # Base pupil diameter with correlation to pulse rate
-        signals['pupil_diameter_left'] = 4.0 + 0.02*(signals['pulse_rate'] - 80) + np.random.normal(0, 0.3, num_points)
+        signals['pupil_diameter_left'][:] = 4.0 + 0.02*(signals['pulse_rate'] - 80) + noise['pupil_diameter_left']
         # Right pupil highly correlated with left but with slight differences
-        signals['pupil_diameter_right'] = signals['pupil_diameter_left'] + np.random.normal(0, 0.1, num_points)
+        signals['pupil_diameter_right'][:] = signals['pupil_diameter_left'] + noise['pupil_diameter_right']
         
         # Gaze position (x,y) with realistic scanning patterns
-        t = np.linspace(0, 2*np.pi*10, num_points)  # Time vector for oscillations
-        signals['gaze_x'] = 5 * np.sin(0.1*t) + 3 * np.sin(0.3*t) + np.random.normal(0, 2, num_points)
-        signals['gaze_y'] = 4 * np.cos(0.1*t) + 2 * np.cos(0.2*t) + np.random.normal(0, 2, num_points)
+        if len(self._sin01) == num_points:
+            sin01, sin03, cos01, cos02 = self._sin01, self._sin03, self._cos01, self._cos02
+        else:
+            sin01, sin03, cos01, cos02 = self._gaze_basis(num_points)
+        signals['gaze_x'][:] = 5 * sin01 + 3 * sin03 + noise['gaze_x']
+        signals['gaze_y'][:] = 4 * cos01 + 2 * cos02 + noise['gaze_y']
         
         # Blink rate (binary indicator with realistic frequency)
         blink_probability = np.ones(num_points) * 0.05  # Base 5% chance of blink
         # Increase blink probability every 20-30 seconds
-        for i in range(0, num_points, np.random.randint(20, 30)):
-            if i < num_points:
-                blink_probability[i:i+2] = 0.8
-        signals['blink_rate'] = (np.random.random(num_points) < blink_probability).astype(float)
+        gaps = self.rng.integers(20, 30, size=num_points//20 + 1)
+        starts = np.cumsum(gaps)
+        starts = starts[starts < num_points - 1]
+        blink_probability[starts] = 0.8
+        blink_probability[starts + 1] = 0.8
+        signals['blink_rate'][:] = self.rng.random(num_points) < blink_probability
         
         # Fixation duration (inversely related to saccade frequency)
-        base_fixation = np.ones(num_points) * 200  # Base fixation of 200ms
-        for i in range(num_points):
-            if signals['blink_rate'][i] > 0.5:  # During blinks
-                base_fixation[i] = 0
-        signals['fixation_duration'] = base_fixation + np.random.normal(0, 30, num_points)
+        base_fixation = np.full(num_points, 200.0)  # Base fixation of 200ms
+        base_fixation[signals['blink_rate'] > 0.5] = 0.0  # During blinks
+        signals['fixation_duration'][:] = base_fixation + noise['fixation_duration']
         
-        # Clip all signals to their valid ranges
-        for param, values in signals.items():
-            if param in sr:
-                signals[param] = np.clip(values, *sr[param])
+        # Clip all signals to their valid ranges in one broadcast pass
+        np.clip(buf, self._lows, self._highs, out=buf)
         
         return signals
     
@@ -149,27 +206,38 @@ class ClinicalDataGenerator:
             
         end_idx = min(start_idx + duration, len(signals['SpO2']))
         actual_duration = end_idx - start_idx
-        x = np.linspace(0, 1, actual_duration)
+        # Effect curves shared by every parameter of this event
+        ramp = np.linspace(0, 1, actual_duration)
+        sin_curve = np.sin(np.pi * ramp)  # Smooth sinusoidal effect
         
-        for param, rules in event_config.items():
-            if param not in signals:
-                continue
-                
-            current_values = signals[param][start_idx:end_idx]
-            base_value = np.mean(current_values)
-            
-            # Apply different effect patterns based on parameter type
-            if 'delta' in rules:
-                effect = rules['delta'] * intensity * np.sin(np.pi * x)  # Smooth sinusoidal effect
-            elif 'min' in rules and 'max' in rules:
-                effect = np.linspace(base_value, (rules['min'] + rules['max'])/2, actual_duration)
-                effect += np.random.normal(0, (rules['max'] - rules['min'])/10, actual_duration)
-            
-            # Apply smoothing and clipping
-            signals[param][start_idx:end_idx] = np.clip(
-                savgol_filter(current_values + effect, 5, 2),
-                *self.config['signal_ranges'].get(param, (-np.inf, np.inf))
-            )
+        # Gather the affected signal windows into one (n_params, duration) block
+        params = [param for param in event_config if param in signals]
+        if not params:
+            return signals
+        current = np.stack([signals[param][start_idx:end_idx] for param in params])
+        
+        # Delta rules: one broadcast multiply-add of the sinusoidal curve for all rows
+        scales = np.array([event_config[param].get('delta', 0.0) for param in params]) * intensity
+        effects = np.empty_like(current)
+        np.multiply(scales[:, None], sin_curve, out=effects)
+        np.add(effects, current, out=effects)
+        
+        # Range rules: ramp from the current mean towards the middle of the target range
+        for row, param in enumerate(params):
+            rules = event_config[param]
+            if 'delta' not in rules and 'min' in rules and 'max' in rules:
+                base_value = np.mean(current[row])
+                target = (rules['min'] + rules['max'])/2
+                effects[row] += base_value + (target - base_value) * ramp
+                effects[row] += self.rng.normal(0, (rules['max'] - rules['min'])/10, actual_duration)
+        
+        # Smooth all affected signals in one call, clip to their ranges and scatter back
+        smoothed = savgol_filter(effects, 5, 2, axis=1)
+        sr = self.config['signal_ranges']
+        bounds = np.array([sr.get(param, (-np.inf, np.inf)) for param in params])
+        np.clip(smoothed, bounds[:, :1], bounds[:, 1:], out=smoothed)
+        for param, values in zip(params, smoothed):
+            signals[param][start_idx:end_idx] = values
             
         return signals
     
@@ -186,15 +254,15 @@ class ClinicalDataGenerator:
             elif 'gaze' in param:
                 param_noise = noise_level * 2.0  # More noise for gaze position
                 
-            noise = np.random.normal(0, param_noise * np.std(values), len(values))
-            signals[param] = np.clip(values + noise, *self.config['signal_ranges'][param])
+            values += self.rng.normal(0, param_noise * np.std(values), len(values))
+            np.clip(values, *self.config['signal_ranges'][param], out=values)
         return signals
     
     def generate_dataset(self, events: List[Dict] = None) -> pd.DataFrame:
         """Generate complete dataset with configurable clinical events"""
         num_points = self.config['duration_hours'] * 60 // self.config['resolution_min']
-        timestamps = [self.config['base_time'] + timedelta(minutes=i*self.config['resolution_min'])
-                     for i in range(num_points)]
+        timestamps = pd.date_range(start=self.config['base_time'], periods=num_points,
+                                   freq=f"{self.config['resolution_min']}min")
         
         signals = self.generate_base_signals(num_points)
         
@@ -220,23 +288,29 @@ class ClinicalDataGenerator:
         
         signals = self.add_sensor_noise(signals)
         
-        # Create DataFrame with proper formatting
-        df = pd.DataFrame({
-            'timestamp': timestamps,
-            **{k: np.round(v, 2) if 'pupil' in k or 'gaze' in k or 'fixation' in k 
-               else np.round(v, 1) if k != 'pulse_rate' and k != 'blink_rate'
-               else v.astype(int)
+        # Create DataFrame with proper formatting (rounded columns are widened back
+        # to float64 so the exported decimals are exact). Going through an Arrow table
+        # keeps every column in its own buffer instead of consolidating same-dtype blocks
+        table = pa.table({
+            'timestamp': pa.array(timestamps),
+            **{k: pa.array(np.round(v.astype(float), 2) if 'pupil' in k or 'gaze' in k or 'fixation' in k 
+                           else np.round(v.astype(float), 1) if k != 'pulse_rate' and k != 'blink_rate'
+                           else v.astype(int))
               for k, v in signals.items()}
         })
+        df = table.to_pandas(types_mapper=pd.ArrowDtype)
         
         # Add metadata
-        df.attrs['generation_config'] = json.dumps(self.config, default=str)
+        df.attrs['generation_config'] = self._config_json
         df.attrs['event_log'] = json.dumps(events or default_events)
         
         return df
         
     def visualize_dataset(self, df: pd.DataFrame, output_path: Optional[str] = None):
         """Generate visualizations of the synthetic data"""
+        # Imported lazily so dataset-only callers never pay matplotlib's import cost
+        import matplotlib.pyplot as plt
+        
         # Create a multi-panel figure
         fig, axes = plt.subplots(3, 2, figsize=(15, 12))
         fig.suptitle('Synthetic Physiological and Eye Tracking Data', fontsize=16)
@@ -292,13 +366,46 @@ class ClinicalDataGenerator:
             
         return fig
 
-def generate_clinical_data(output_format: str = 'dataframe', save_dir: str = None, **kwargs) -> Union[pd.DataFrame, str, bytes]:
+def _json_default(value):
+    """orjson fallback for pandas Timestamps, which it does not serialize natively"""
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+# On-disk column types: measurements carry at most two decimals, well within
+# float32 precision, and the integer indicators fit in int16/int8
+PARQUET_SCHEMA = pa.schema([
+    ('timestamp', pa.timestamp('us')),
+    ('SpO2', pa.float32()),
+    ('pulse_rate', pa.int16()),
+    ('blood_pressure_sys', pa.float32()),
+    ('resp_rate', pa.float32()),
+    ('temperature', pa.float32()),
+    ('pupil_diameter_left', pa.float32()),
+    ('pupil_diameter_right', pa.float32()),
+    ('gaze_x', pa.float32()),
+    ('gaze_y', pa.float32()),
+    ('blink_rate', pa.int8()),
+    ('fixation_duration', pa.float32())
+])
+
+def write_parquet(df: pd.DataFrame, path: str):
+    """Write a dataset to Parquet with the compact PARQUET_SCHEMA and ZSTD compression"""
+    table = pa.Table.from_pandas(df, schema=PARQUET_SCHEMA, preserve_index=False)
+    pq.write_table(table, path, compression='zstd', compression_level=3)
+
+def generate_clinical_data(output_format: str = 'dataframe', save_dir: str = None,
+                           save_csv: bool = False, save_viz: bool = False,
+                           **kwargs) -> Union[pd.DataFrame, str, bytes, pa.RecordBatch]:
     """
     Generate synthetic clinical data with multiple output format options
     
     Args:
-        output_format: One of 'dataframe', 'csv', 'parquet', 'dict', 'json'
+        output_format: One of 'dataframe', 'csv', 'parquet', 'dict', 'records', 'json'
+            ('records' returns a zero-copy pyarrow RecordBatch instead of per-row dicts)
         save_dir: Directory to save output files (default: testing/physiological)
+        save_csv: Also write a CSV copy in 'dataframe' mode
+        save_viz: Also render a PNG visualization in 'dataframe' mode
         **kwargs: Configuration overrides
         
     Returns:
@@ -320,12 +427,14 @@ def generate_clinical_data(output_format: str = 'dataframe', save_dir: str = Non
         # Save data in requested format
         if output_format == 'dataframe':
             # Save a copy to the specified directory
-            df.to_csv(os.path.join(save_dir, f"{base_filename}.csv"), index=False)
-            df.to_parquet(os.path.join(save_dir, f"{base_filename}.parquet"), index=False)
+            write_parquet(df, os.path.join(save_dir, f"{base_filename}.parquet"))
+            if save_csv:
+                df.to_csv(os.path.join(save_dir, f"{base_filename}.csv"), index=False)
             
             # Generate and save visualization
-            viz_path = os.path.join(save_dir, f"{base_filename}_viz.png")
-            generator.visualize_dataset(df, viz_path)
+            if save_viz:
+                viz_path = os.path.join(save_dir, f"{base_filename}_viz.png")
+                generator.visualize_dataset(df, viz_path)
             
             return df
             
@@ -337,20 +446,24 @@ def generate_clinical_data(output_format: str = 'dataframe', save_dir: str = Non
             
         elif output_format == 'parquet':
             output_path = os.path.join(save_dir, f"{base_filename}.parquet")
-            df.to_parquet(output_path, index=False)
+            write_parquet(df, output_path)
             logger.info(f"Parquet data saved to {output_path}")
             return output_path
             
         elif output_format == 'json':
             output_path = os.path.join(save_dir, f"{base_filename}.json")
-            with open(output_path, 'w') as f:
-                json.dump(df.to_dict(orient='records'), f, default=str)
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(df.to_dict(orient='records'), default=_json_default,
+                                     option=orjson.OPT_SERIALIZE_NUMPY))
             logger.info(f"JSON data saved to {output_path}")
             return output_path
             
         elif output_format == 'dict':
             return df.to_dict(orient='records')
             
+        elif output_format == 'records':
+            return pa.RecordBatch.from_pandas(df, preserve_index=False)
+            
         else:
             raise ValueError(f"Unsupported output format: {output_format}")
             
@@ -358,12 +471,56 @@ def generate_clinical_data(output_format: str = 'dataframe', save_dir: str = Non
         logger.error(f"Data generation failed: {str(e)}")
         raise
 
+def _generate_patient(seed: int, config: Optional[Dict], events: Optional[List[Dict]],
+                      save_dir: str, run_stamp: str) -> str:
+    """Generate one seeded patient record and write it to Parquet"""
+    patient_config = {**(config or copy.deepcopy(DEFAULT_CONFIG)), 'seed': seed}
+    df = ClinicalDataGenerator(patient_config).generate_dataset(events)
+    
+    output_path = os.path.join(save_dir, f"eye_tracking_data_{run_stamp}_seed{seed}.parquet")
+    write_parquet(df, output_path)
+    return output_path
+
+def generate_cohort(n_patients: int, base_seed: int = 0, save_dir: str = None,
+                    n_jobs: int = -1, config: Optional[Dict] = None,
+                    events: Optional[List[Dict]] = None) -> List[str]:
+    """
+    Generate a cohort of independent patient records in parallel
+    
+    Args:
+        n_patients: Number of patient records to generate
+        base_seed: Seed of the first patient; patient i uses base_seed + i
+        save_dir: Directory to save output files (default: testing/physiological)
+        n_jobs: Number of joblib worker processes (-1 uses all cores)
+        config: Generator configuration shared by every patient (default: DEFAULT_CONFIG);
+            its 'seed' key is replaced per patient
+        events: Clinical events applied to every patient (default: generate_dataset's defaults)
+        
+    Returns:
+        Parquet file paths, one per patient in seed order
+    """
+    # Imported lazily so single-dataset callers never pay joblib's import cost
+    from joblib import Parallel, delayed
+    
+    save_dir = save_dir or PHYSIO_DIR
+    ensure_dir_exists(save_dir)
+    run_stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    
+    paths = Parallel(n_jobs=n_jobs, backend='loky')(
+        delayed(_generate_patient)(base_seed + i, config, events, save_dir, run_stamp)
+        for i in range(n_patients)
+    )
+    logger.info(f"Generated a cohort of {n_patients} patients in {save_dir}")
+    return paths
+
 # Example production usage
 if __name__ == "__main__":
     try:
         # Generate data with custom events
         clinical_data = generate_clinical_data(
             output_format='dataframe',
+            save_csv=True,
+            save_viz=True,
             events=[
                 {'type': 'hypoxemia', 'start': 45, 'duration': 15, 'intensity': 0.9},
                 {'type': 'tachycardia', 'start': 90, 'duration': 20, 'intensity': 1.2},
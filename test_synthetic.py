@@ -20,18 +20,10 @@ def main():
     physio_dir = os.path.join(testing_dir, "physiological")
     
     print(f"Creating directory: {testing_dir}")
-    if not os.path.exists(testing_dir):
-        os.makedirs(testing_dir)
-        print(f"Created directory: {testing_dir}")
-    else:
-        print(f"Directory already exists: {testing_dir}")
+    os.makedirs(testing_dir, exist_ok=True)
     
     print(f"Creating directory: {physio_dir}")
-    if not os.path.exists(physio_dir):
-        os.makedirs(physio_dir)
-        print(f"Created directory: {physio_dir}")
-    else:
-        print(f"Directory already exists: {physio_dir}")
+    os.makedirs(physio_dir, exist_ok=True)
     
     print(f"Saving data to: {physio_dir}")
     
@@ -51,6 +43,8 @@ def main():
         clinical_data = generate_clinical_data(
             output_format='dataframe',
             save_dir=physio_dir,
+            save_csv=True,
+            save_viz=True,
             events=[
                 {'type': 'hypoxemia', 'start': 45, 'duration': 15, 'intensity': 0.9},
                 {'type': 'tachycardia', 'start': 90, 'duration': 20, 'intensity': 1.2},